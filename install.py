@@ -5,13 +5,19 @@ Installs all required tools and dependencies for the recon pipeline.
 """
 
 import os
+import re
 import sys
 import subprocess
-import shutil
 import logging
 import argparse
+import functools
+import tempfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, List, Sequence, Tuple, Optional, Set
+
+from pathscan import executables_on_path
 
 # Configure logging
 logging.basicConfig(
@@ -23,137 +29,268 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Environment for apt so dpkg never stops at an interactive prompt
+APT_ENV = {**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
+
+# Lines of streamed command output kept for error reports
+STREAM_TAIL_LINES = 200
+
+# Version numbers such as "v2.6.3" or "1.21", matched against raw tool output
+_VERSION_RE = re.compile(rb'v?\d+\.\d+(?:\.\d+)?')
+
+@functools.lru_cache(maxsize=1)
+def _is_kali_linux() -> bool:
+    """Check /etc/os-release (or /etc/issue) for Kali, reading them only once."""
+    try:
+        content = Path('/etc/os-release').read_text(errors='ignore')
+    except OSError:
+        content = ''
+    
+    # Compare the ID field exactly; a loose 'kali' substring also matches
+    # unrelated entries on other distributions
+    for line in content.splitlines():
+        if line.startswith('ID='):
+            return line[3:].strip().strip('"\'') == 'kali'
+    
+    # Alternative check for Kali, only when os-release has no ID
+    try:
+        return 'kali' in Path('/etc/issue').read_text(errors='ignore').lower()
+    except OSError:
+        return False
+
 class ReconInstaller:
+    GO_TOOLS = (
+        ("subfinder", "github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest"),
+        ("amass", "github.com/owasp-amass/amass/v4/...@latest"),
+        ("dnsx", "github.com/projectdiscovery/dnsx/cmd/dnsx@latest"),
+        ("naabu", "github.com/projectdiscovery/naabu/v2/cmd/naabu@latest"),
+        ("httpx", "github.com/projectdiscovery/httpx/cmd/httpx@latest"),
+        ("nuclei", "github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest"),
+        ("gau", "github.com/lc/gau/v2/cmd/gau@latest"),
+        ("unfurl", "github.com/tomnomnom/unfurl@latest"),
+        ("gowitness", "github.com/jaeles-project/gowitness@latest")
+    )
+    
+    APT_PACKAGES = (
+        "golang-go",
+        "git",
+        "curl",
+        "jq",
+        "python3-pip",
+        "chromium",
+        "build-essential",
+        "pkg-config",
+        "eatmydata"
+    )
+    
+    # Leaf directories only; parents such as output/ are created along the way
+    DIRECTORIES = (
+        "output/js_out",
+        "screenshots"
+    )
+
     def __init__(self):
-        self.go_tools = [
-            ("subfinder", "github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest"),
-            ("amass", "github.com/owasp-amass/amass/v4/...@latest"),
-            ("dnsx", "github.com/projectdiscovery/dnsx/cmd/dnsx@latest"),
-            ("naabu", "github.com/projectdiscovery/naabu/v2/cmd/naabu@latest"),
-            ("httpx", "github.com/projectdiscovery/httpx/cmd/httpx@latest"),
-            ("nuclei", "github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest"),
-            ("gau", "github.com/lc/gau/v2/cmd/gau@latest"),
-            ("unfurl", "github.com/tomnomnom/unfurl@latest"),
-            ("gowitness", "github.com/jaeles-project/gowitness@latest")
-        ]
-        
-        self.apt_packages = [
-            "golang-go",
-            "git",
-            "curl",
-            "jq",
-            "python3-pip",
-            "chromium",
-            "build-essential",
-            "pkg-config"
-        ]
-        
-        self.directories = [
-            "output",
-            "output/js_out",
-            "screenshots"
-        ]
+        # Installed APT package names, filled by a single dpkg-query call
+        self._apt_installed: Optional[Set[str]] = None
 
-    def run_command(self, command: List[str], check: bool = True) -> Tuple[bool, str]:
+    def run_command(self, command: List[str], check: bool = True, env: Optional[Dict[str, str]] = None,
+                    stream: bool = False, cwd: Optional[str] = None) -> Tuple[bool, str]:
         """Run a command and return success status and output."""
+        if stream:
+            return self.stream_command(command, check=check, env=env, cwd=cwd)
+        
         try:
             result = subprocess.run(
                 command,
                 capture_output=True,
                 text=True,
-                check=check
+                check=check,
+                env=env,
+                cwd=cwd
             )
             return True, result.stdout
         except subprocess.CalledProcessError as e:
             return False, e.stderr
+        except OSError as e:
+            # Command not found or not executable
+            return False, str(e)
+
+    def stream_command(self, command: List[str], check: bool = True,
+                       env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Tuple[bool, str]:
+        """Run a command, logging its output as it arrives and keeping only the tail."""
+        tail = deque(maxlen=STREAM_TAIL_LINES)
+        try:
+            with subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+                errors="replace",
+                env=env,
+                cwd=cwd
+            ) as process:
+                for line in process.stdout:
+                    line = line.rstrip("\n")
+                    logger.debug(line)
+                    tail.append(line)
+        except OSError as e:
+            # Command not found or not executable
+            return False, str(e)
+        
+        output = "\n".join(tail)
+        if check and process.returncode != 0:
+            return False, output
+        return True, output
+
+    def apt_command(self, *args: str) -> List[str]:
+        """Build a non-interactive apt command line."""
+        command = ["apt-get", "-o", "Dpkg::Use-Pty=0", "-o", "Acquire::Retries=3"] + list(args)
+        # eatmydata skips dpkg's fsync() calls, which dominate install time
+        if self.check_command_exists("eatmydata"):
+            command.insert(0, "eatmydata")
+        return command
+
+    def run_apt_command(self, *args: str) -> Tuple[bool, str]:
+        """Run apt non-interactively."""
+        return self.run_command(self.apt_command(*args), env=APT_ENV, stream=True)
+
+    @functools.cached_property
+    def _path_index(self) -> Dict[str, str]:
+        """Map executable names to full paths, scanning PATH only once."""
+        return executables_on_path()
+
+    def _invalidate_path_index(self):
+        """Forget the cached PATH scan after new binaries were installed."""
+        self.__dict__.pop("_path_index", None)
 
     def check_command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH."""
-        return shutil.which(command) is not None
+        return command in self._path_index
+
+    def _probe_version(self, tool_name: str, flag: str) -> Optional[str]:
+        """Run a tool with a single version flag and parse its output."""
+        try:
+            result = subprocess.run([tool_name, flag], capture_output=True)
+        except OSError:
+            return None
+        
+        output = result.stdout.strip()
+        if not output:
+            return None
+        
+        # Extract version number straight from the raw output
+        version_match = _VERSION_RE.search(output)
+        if version_match:
+            return version_match.group().decode()
+        output = output.decode(errors="replace")
+        return output[:50] + "..." if len(output) > 50 else output
 
     def get_tool_version(self, tool_name: str) -> Optional[str]:
         """Get version of an installed tool."""
+        if not self.check_command_exists(tool_name):
+            return None
+        
         version_flags = ["--version", "-version", "-v", "version"]
         
+        # Flags are tried in priority order; later ones (e.g. `gau version`) may do real work
         for flag in version_flags:
-            success, output = self.run_command([tool_name, flag], check=False)
-            if success and output.strip():
-                # Extract version from output (common patterns)
-                lines = output.strip().split('\n')
-                for line in lines:
-                    if 'version' in line.lower() or 'v' in line:
-                        # Try to extract version number
-                        import re
-                        version_match = re.search(r'v?\d+\.\d+\.?\d*', line)
-                        if version_match:
-                            return version_match.group()
-                return output.strip()[:50] + "..." if len(output.strip()) > 50 else output.strip()
+            version = self._probe_version(tool_name, flag)
+            if version:
+                return version
         return None
 
-    def update_system_packages(self) -> bool:
-        """Update system packages using apt."""
+    def update_system_packages(self, full_upgrade: bool = False) -> bool:
+        """Refresh APT package lists and optionally upgrade installed packages."""
         logger.info("[+] Updating APT packages...")
         
         commands = [
-            ["apt", "update"],
-            ["apt", "upgrade", "-y"]
+            ["update"]
         ]
+        # Upgrading the whole system is slow and unrelated to our tools, so opt-in only
+        if full_upgrade:
+            commands.append(["upgrade", "-y"])
         
         for cmd in commands:
-            success, output = self.run_command(cmd)
+            success, output = self.run_apt_command(*cmd)
             if not success:
-                logger.error(f"Failed to run: {' '.join(cmd)}")
+                logger.error(f"Failed to run: {' '.join(self.apt_command(*cmd))}")
                 logger.error(f"Error: {output}")
                 return False
         
         logger.info("[✓] System packages updated successfully")
         return True
 
+    def _installed_apt_packages(self) -> Set[str]:
+        """Return the set of installed APT packages (queried once and cached)."""
+        if self._apt_installed is None:
+            success, output = self.run_command(
+                ["dpkg-query", "-W", "-f=${Package} ${db:Status-Abbrev}\\n"],
+                check=False
+            )
+            installed = set()
+            if success:
+                for line in output.splitlines():
+                    fields = line.split()
+                    # Only count fully installed packages ("ii"), not removed ones
+                    if len(fields) >= 2 and fields[1].startswith("ii"):
+                        installed.add(fields[0].split(":", 1)[0])
+            self._apt_installed = installed
+        return self._apt_installed
+
     def check_apt_package_installed(self, package: str) -> bool:
         """Check if an APT package is installed."""
-        success, output = self.run_command(["dpkg", "-l", package], check=False)
-        return success and package in output
+        return package in self._installed_apt_packages()
 
-    def force_install_apt_packages(self) -> bool:
-        """Force install APT packages (reinstall if already installed)."""
-        logger.info("[+] Force installing APT packages...")
+    def _apt_install(self, force: bool) -> bool:
+        """Install required APT packages, reinstalling all of them when forced."""
+        if force:
+            logger.info("[+] Force installing APT packages...")
+            packages = list(self.APT_PACKAGES)
+            logger.info(f"[+] Force installing packages: {', '.join(packages)}")
+        else:
+            logger.info("[+] Installing dependencies...")
+            
+            # Check which packages are missing (one dpkg-query for all of them)
+            installed = self._installed_apt_packages()
+            packages = []
+            for package in self.APT_PACKAGES:
+                if package not in installed:
+                    packages.append(package)
+                    logger.info(f"[+] {package} not found, will install")
+                else:
+                    logger.info(f"[✓] {package} already installed")
+            
+            if not packages:
+                logger.info("[✓] All APT packages are already installed")
+                return True
+            
+            logger.info(f"[+] Installing missing packages: {', '.join(packages)}")
         
-        # Force install all packages
-        logger.info(f"[+] Force installing packages: {', '.join(self.apt_packages)}")
-        success, output = self.run_command(["apt", "install", "-y", "--reinstall"] + self.apt_packages)
+        # One transaction; recommended extras (hundreds of MB for chromium) are skipped
+        args = ["install", "-y", "--no-install-recommends"]
+        if force:
+            args.append("--reinstall")
+        success, output = self.run_apt_command(*args, *packages)
         if not success:
             logger.error(f"Failed to install APT packages: {output}")
             return False
         
-        logger.info("[✓] APT packages force installed successfully")
+        self._apt_installed = None
+        self._invalidate_path_index()
+        if force:
+            logger.info("[✓] APT packages force installed successfully")
+        else:
+            logger.info("[✓] APT packages installed successfully")
         return True
 
+    def force_install_apt_packages(self) -> bool:
+        """Force install APT packages (reinstall if already installed)."""
+        return self._apt_install(force=True)
+
     def install_apt_packages(self) -> bool:
         """Install required APT packages."""
-        logger.info("[+] Installing dependencies...")
-        
-        # Check which packages are missing
-        missing_packages = []
-        for package in self.apt_packages:
-            if not self.check_apt_package_installed(package):
-                missing_packages.append(package)
-                logger.info(f"[+] {package} not found, will install")
-            else:
-                logger.info(f"[✓] {package} already installed")
-        
-        if not missing_packages:
-            logger.info("[✓] All APT packages are already installed")
-            return True
-        
-        # Install missing packages
-        logger.info(f"[+] Installing missing packages: {', '.join(missing_packages)}")
-        success, output = self.run_command(["apt", "install", "-y"] + missing_packages)
-        if not success:
-            logger.error(f"Failed to install APT packages: {output}")
-            return False
-        
-        logger.info("[✓] APT packages installed successfully")
-        return True
+        return self._apt_install(force=False)
 
     def setup_go_environment(self) -> bool:
         """Setup Go environment and ensure GOPATH is configured."""
@@ -187,62 +324,90 @@ class ReconInstaller:
         
         return True
 
+    def prewarm_go_module_cache(self, tools: Sequence[Tuple[str, str]]) -> bool:
+        """Download the modules for all tools in one batch before building them."""
+        success, output = self.run_command(["go", "env", "GOMODCACHE"])
+        if success:
+            logger.info(f"[+] Prefetching Go modules into {output.strip()}...")
+        
+        # A throwaway module lets a single `go get` resolve every tool at once,
+        # fetching shared dependencies only once and in parallel
+        with tempfile.TemporaryDirectory(prefix="ghostrecon-gomod-") as module_dir:
+            success, output = self.run_command(["go", "mod", "init", "ghostrecon/prewarm"], cwd=module_dir)
+            if success:
+                tool_paths = [tool_path for _, tool_path in tools]
+                success, output = self.run_command(["go", "get"] + tool_paths, stream=True, cwd=module_dir)
+        
+        if not success:
+            # Not fatal: each `go install` still fetches whatever it is missing
+            logger.warning(f"[!] Could not prefetch Go modules: {output}")
+        return success
+
+    def _go_install_tools(self, tools: Sequence[Tuple[str, str]]) -> bool:
+        """Run `go install` for several tools concurrently."""
+        if not tools:
+            return True
+        
+        self.prewarm_go_module_cache(tools)
+        
+        all_good = True
+        max_workers = min(len(tools), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for tool_name, tool_path in tools:
+                logger.info(f"[+] Installing {tool_name}...")
+                future = executor.submit(self.run_command, ["go", "install", "-v", tool_path], stream=True)
+                futures[future] = tool_name
+            
+            # Results are logged from this thread only, so output stays readable
+            for future in as_completed(futures):
+                tool_name = futures[future]
+                success, output = future.result()
+                if not success:
+                    logger.error(f"Failed to install {tool_name}: {output}")
+                    all_good = False
+                    continue
+                
+                # Pick up the freshly installed binary on the next lookup
+                if not self.check_command_exists(tool_name):
+                    self._invalidate_path_index()
+                
+                # Verify installation
+                version = self.get_tool_version(tool_name)
+                if version:
+                    logger.info(f"[✓] Installed {tool_name} {version}")
+                else:
+                    logger.warning(f"[!] {tool_name} installed but version check failed")
+        
+        return all_good
+
     def force_install_go_tools(self) -> bool:
         """Force install Go-based tools (reinstall if already installed)."""
         logger.info("[+] Force installing Go-based tools...")
         
-        for tool_name, tool_path in self.go_tools:
-            logger.info(f"[+] Force installing {tool_name}...")
-            
-            # Force install (go install will overwrite existing)
-            success, output = self.run_command(["go", "install", "-v", tool_path])
-            if not success:
-                logger.error(f"Failed to install {tool_name}: {output}")
-                return False
-            
-            # Verify installation
-            version = self.get_tool_version(tool_name)
-            if version:
-                logger.info(f"[✓] Installed {tool_name} {version}")
-            else:
-                logger.warning(f"[!] {tool_name} installed but version check failed")
-        
-        return True
+        # Force install (go install will overwrite existing)
+        return self._go_install_tools(self.GO_TOOLS)
 
     def install_go_tools(self) -> bool:
         """Install Go-based tools."""
         logger.info("[+] Installing Go-based tools...")
         
-        for tool_name, tool_path in self.go_tools:
+        missing_tools = []
+        for tool_name, tool_path in self.GO_TOOLS:
             # Check if tool is already installed
             existing_version = self.get_tool_version(tool_name)
             if existing_version:
                 logger.info(f"[✓] {tool_name} {existing_version} already installed")
                 continue
-            
-            logger.info(f"[+] Installing {tool_name}...")
-            
-            # Force install (remove existing if any)
-            logger.info(f"[+] Force installing {tool_name}...")
-            success, output = self.run_command(["go", "install", "-v", tool_path])
-            if not success:
-                logger.error(f"Failed to install {tool_name}: {output}")
-                return False
-            
-            # Verify installation
-            version = self.get_tool_version(tool_name)
-            if version:
-                logger.info(f"[✓] Installed {tool_name} {version}")
-            else:
-                logger.warning(f"[!] {tool_name} installed but version check failed")
+            missing_tools.append((tool_name, tool_path))
         
-        return True
+        return self._go_install_tools(missing_tools)
 
     def update_nuclei_templates(self) -> bool:
         """Update Nuclei templates."""
         logger.info("[+] Updating Nuclei templates...")
         
-        success, output = self.run_command(["nuclei", "-update-templates"])
+        success, output = self.run_command(["nuclei", "-update-templates", "-silent"], stream=True)
         if not success:
             logger.error(f"Failed to update Nuclei templates: {output}")
             return False
@@ -254,24 +419,35 @@ class ReconInstaller:
         """Create required directories."""
         logger.info("[+] Creating directories...")
         
-        for directory in self.directories:
+        failures = []
+        for directory in self.DIRECTORIES:
             try:
-                Path(directory).mkdir(parents=True, exist_ok=True)
+                os.makedirs(directory, exist_ok=True)
                 logger.info(f"[✓] Created directory: {directory}/")
-            except Exception as e:
-                logger.error(f"Failed to create directory {directory}: {e}")
-                return False
+            except OSError as e:
+                failures.append((directory, e))
         
-        return True
+        # Try every directory before reporting, so one failure doesn't hide others
+        for directory, error in failures:
+            logger.error(f"Failed to create directory {directory}: {error}")
+        
+        return not failures
 
     def verify_installations(self) -> bool:
         """Verify all tools are installed correctly."""
         logger.info("[+] Verifying installations...")
         
         all_good = True
+        go_tool_names = [tool_name for tool_name, _ in self.GO_TOOLS]
+        other_tools = ["ffuf", "curl", "jq", "git"]
+        tool_names = go_tool_names + other_tools
         
-        for tool_name, _ in self.go_tools:
-            version = self.get_tool_version(tool_name)
+        # Probe every tool concurrently, then report in a stable order
+        with ThreadPoolExecutor(max_workers=len(tool_names)) as executor:
+            versions = dict(zip(tool_names, executor.map(self.get_tool_version, tool_names)))
+        
+        for tool_name in go_tool_names:
+            version = versions[tool_name]
             if version:
                 logger.info(f"[✓] {tool_name}: {version}")
             else:
@@ -279,10 +455,9 @@ class ReconInstaller:
                 all_good = False
         
         # Check other tools
-        other_tools = ["ffuf", "curl", "jq", "git"]
         for tool in other_tools:
             if self.check_command_exists(tool):
-                version = self.get_tool_version(tool)
+                version = versions[tool]
                 if version:
                     logger.info(f"[✓] {tool}: {version}")
                 else:
@@ -294,32 +469,53 @@ class ReconInstaller:
 
     def check_kali_linux(self) -> bool:
         """Check if running on Kali Linux."""
-        try:
-            with open('/etc/os-release', 'r') as f:
-                content = f.read().lower()
-                if 'kali' in content:
-                    return True
-        except FileNotFoundError:
-            pass
-        
-        # Alternative check for Kali
-        try:
-            with open('/etc/issue', 'r') as f:
-                content = f.read().lower()
-                if 'kali' in content:
-                    return True
-        except FileNotFoundError:
-            pass
-        
-        return False
+        return _is_kali_linux()
+
+    def go_toolchain_ready(self) -> bool:
+        """Check if Go and the C toolchain used by cgo are already available."""
+        return all(self.check_command_exists(command) for command in ("go", "gcc", "pkg-config"))
+
+    def run_steps(self, steps: List[Tuple[str, Callable[[], bool], Set[str]]]) -> bool:
+        """Run install steps concurrently, starting each once all of its dependencies succeeded."""
+        pending = list(steps)
+        running = {}
+        completed = set()
+        failed = False
+        
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            while pending or running:
+                # Stop scheduling after a failure, but let running steps finish
+                if not failed:
+                    for step in [step for step in pending if step[2] <= completed]:
+                        step_name, step_func, _ = step
+                        pending.remove(step)
+                        logger.info(f"\n--- {step_name} ---")
+                        running[executor.submit(step_func)] = step_name
+                
+                if not running:
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step_name = running.pop(future)
+                    if future.result():
+                        completed.add(step_name)
+                    else:
+                        logger.error(f"❌ Installation failed at: {step_name}")
+                        failed = True
+        
+        return not failed and not pending
 
-    def install(self, force: bool = False) -> bool:
+    def install(self, force: bool = False, full_upgrade: bool = False) -> bool:
         """Main installation method."""
         logger.info("🚀 Starting Automated Recon Pipeline Installation...")
         
         if force:
             logger.info("🔧 Force installation mode enabled - will reinstall all tools")
         
+        if full_upgrade:
+            logger.info("🔧 Full upgrade enabled - will upgrade all system packages")
+        
         # Check if running on Kali Linux
         if not self.check_kali_linux():
             logger.error("❌ This tool is designed specifically for Kali Linux")
@@ -331,35 +527,40 @@ class ReconInstaller:
             logger.error("This script must be run as root (use sudo)")
             return False
         
-        steps = [
-            ("Update system packages", self.update_system_packages),
-        ]
-        
         # Choose APT installation method based on force flag
         if force:
-            steps.append(("Force install APT packages", self.force_install_apt_packages))
+            apt_step = "Force install APT packages"
+            apt_func = self.force_install_apt_packages
         else:
-            steps.append(("Install APT packages", self.install_apt_packages))
-        
-        steps.append(("Setup Go environment", self.setup_go_environment))
+            apt_step = "Install APT packages"
+            apt_func = self.install_apt_packages
         
         # Choose Go tools installation method based on force flag
         if force:
-            steps.append(("Force install Go tools", self.force_install_go_tools))
+            go_step = "Force install Go tools"
+            go_func = self.force_install_go_tools
         else:
-            steps.append(("Install Go tools", self.install_go_tools))
-        
-        steps.extend([
-            ("Update Nuclei templates", self.update_nuclei_templates),
-            ("Create directories", self.create_directories),
-            ("Verify installations", self.verify_installations)
-        ])
-        
-        for step_name, step_func in steps:
-            logger.info(f"\n--- {step_name} ---")
-            if not step_func():
-                logger.error(f"❌ Installation failed at: {step_name}")
-                return False
+            go_step = "Install Go tools"
+            go_func = self.install_go_tools
+        
+        # Go builds only wait for APT when the Go toolchain comes from this APT run
+        if not force and self.go_toolchain_ready():
+            go_env_deps = set()
+        else:
+            go_env_deps = {apt_step}
+        
+        steps = [
+            ("Update system packages", lambda: self.update_system_packages(full_upgrade), set()),
+            (apt_step, apt_func, {"Update system packages"}),
+            ("Setup Go environment", self.setup_go_environment, go_env_deps),
+            (go_step, go_func, {"Setup Go environment"}),
+            ("Update Nuclei templates", self.update_nuclei_templates, {go_step}),
+            ("Create directories", self.create_directories, set()),
+            ("Verify installations", self.verify_installations, {apt_step, go_step, "Create directories"})
+        ]
+        
+        if not self.run_steps(steps):
+            return False
         
         logger.info("\n🎉 Installation complete!")
         logger.info("💡 Next steps:")
@@ -379,6 +580,7 @@ def main():
 Examples:
   sudo python3 install.py          # Normal installation
   sudo python3 install.py --force  # Force reinstall all tools
+  sudo python3 install.py --full-upgrade  # Also upgrade all system packages
         """
     )
     
@@ -388,12 +590,18 @@ Examples:
         help="Force reinstall all tools (even if already installed)"
     )
     
+    parser.add_argument(
+        "--full-upgrade",
+        action="store_true",
+        help="Run 'apt-get upgrade' on all system packages before installing"
+    )
+    
     args = parser.parse_args()
     
     installer = ReconInstaller()
     
     try:
-        success = installer.install(force=args.force)
+        success = installer.install(force=args.force, full_upgrade=args.full_upgrade)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         logger.info("\n⚠️  Installation interrupted by user")
@@ -0,0 +1,27 @@
+"""
+Automated Recon Pipeline Tool - PATH lookup shared by the installer and the recon script.
+"""
+
+import os
+from typing import Dict
+
+def executables_on_path() -> Dict[str, str]:
+    """Map the names of all executables on PATH to their full paths, listing each directory only once."""
+    index: Dict[str, str] = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Earlier PATH entries win, as with the shell's own lookup
+                    if entry.name in index:
+                        continue
+                    try:
+                        if entry.is_file() and entry.stat().st_mode & 0o111:
+                            index[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return index
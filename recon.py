@@ -6,12 +6,23 @@ Runs comprehensive reconnaissance on a target domain.
 
 import os
 import sys
-import subprocess
-import shutil
+import asyncio
 import logging
 import argparse
+import hashlib
+import http.client
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Optional
+from urllib.parse import parse_qsl, urlsplit
+from typing import Callable, Deque, Dict, Iterator, List, Set, Tuple, Optional
+
+from pathscan import executables_on_path
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +34,128 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Child output is read in chunks of this size; only this many trailing lines are kept
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_TAIL_LINES = 200
+
+# Most stages wait on the network, so allow more child processes than there are cores
+MAX_CHILDREN = (os.cpu_count() or 1) * 2
+
+# Results of slow-changing discovery stages are reused across runs for a while
+CACHE_PATH = Path.home() / ".ghostrecon" / "cache.db"
+HOUR = 60 * 60
+
+# Record types requested from dnsx, as keys of its JSON output
+DNS_RECORD_TYPES = ("a", "aaaa", "cname", "ns")
+
+# nmap's 1000 most common TCP ports, the same list naabu uses for -top-ports 1000
+TOP_1000_PORTS = (
+    "1,3-4,6-7,9,13,17,19-26,30,32-33,37,42-43,49,53,70,79-85,88-90,99-100,106,109-111,113,119,125,135,"
+    "139,143-144,146,161,163,179,199,211-212,222,254-256,259,264,280,301,306,311,340,366,389,406-407,"
+    "416-417,425,427,443-445,458,464-465,481,497,500,512-515,524,541,543-545,548,554-555,563,587,593,"
+    "616-617,625,631,636,646,648,666-668,683,687,691,700,705,711,714,720,722,726,749,765,777,783,787,"
+    "800-801,808,843,873,880,888,898,900-903,911-912,981,987,990,992-993,995,999-1002,1007,1009-1011,"
+    "1021-1100,1102,1104-1108,1110-1114,1117,1119,1121-1124,1126,1130-1132,1137-1138,1141,1145,1147-1149,"
+    "1151-1152,1154,1163-1166,1169,1174-1175,1183,1185-1187,1192,1198-1199,1201,1213,1216-1218,1233-1234,"
+    "1236,1244,1247-1248,1259,1271-1272,1277,1287,1296,1300-1301,1309-1311,1322,1328,1334,1352,1417,"
+    "1433-1434,1443,1455,1461,1494,1500-1501,1503,1521,1524,1533,1556,1580,1583,1594,1600,1641,1658,1666,"
+    "1687-1688,1700,1717-1721,1723,1755,1761,1782-1783,1801,1805,1812,1839-1840,1862-1864,1875,1900,1914,"
+    "1935,1947,1971-1972,1974,1984,1998-2010,2013,2020-2022,2030,2033-2035,2038,2040-2043,2045-2049,2065,"
+    "2068,2099-2100,2103,2105-2107,2111,2119,2121,2126,2135,2144,2160-2161,2170,2179,2190-2191,2196,2200,"
+    "2222,2251,2260,2288,2301,2323,2366,2381-2383,2393-2394,2399,2401,2492,2500,2522,2525,2557,2601-2602,"
+    "2604-2605,2607-2608,2638,2701-2702,2710,2717-2718,2725,2800,2809,2811,2869,2875,2909-2910,2920,"
+    "2967-2968,2998,3000-3001,3003,3005-3007,3011,3013,3017,3030-3031,3052,3071,3077,3128,3168,3211,3221,"
+    "3260-3261,3268-3269,3283,3300-3301,3306,3322-3325,3333,3351,3367,3369-3372,3389-3390,3404,3476,3493,"
+    "3517,3527,3546,3551,3580,3659,3689-3690,3703,3737,3766,3784,3800-3801,3809,3814,3826-3828,3851,3869,"
+    "3871,3878,3880,3889,3905,3914,3918,3920,3945,3971,3986,3995,3998,4000-4006,4045,4111,4125-4126,4129,"
+    "4224,4242,4279,4321,4343,4443-4446,4449,4550,4567,4662,4848,4899-4900,4998,5000-5004,5009,5030,5033,"
+    "5050-5051,5054,5060-5061,5080,5087,5100-5102,5120,5190,5200,5214,5221-5222,5225-5226,5269,5280,5298,"
+    "5357,5405,5414,5431-5432,5440,5500,5510,5544,5550,5555,5560,5566,5631,5633,5666,5678-5679,5718,5730,"
+    "5800-5802,5810-5811,5815,5822,5825,5850,5859,5862,5877,5900-5904,5906-5907,5910-5911,5915,5922,5925,"
+    "5950,5952,5959-5963,5987-5989,5998-6007,6009,6025,6059,6100-6101,6106,6112,6123,6129,6156,6346,6389,"
+    "6502,6510,6543,6547,6565-6567,6580,6646,6666-6669,6689,6692,6699,6779,6788-6789,6792,6839,6881,6901,"
+    "6969,7000-7002,7004,7007,7019,7025,7070,7100,7103,7106,7200-7201,7402,7435,7443,7496,7512,7625,7627,"
+    "7676,7741,7777-7778,7800,7911,7920-7921,7937-7938,7999-8002,8007-8011,8021-8022,8031,8042,8045,"
+    "8080-8090,8093,8099-8100,8180-8181,8192-8194,8200,8222,8254,8290-8292,8300,8333,8383,8400,8402,8443,"
+    "8500,8600,8649,8651-8652,8654,8701,8800,8873,8888,8899,8994,9000-9003,9009-9011,9040,9050,9071,"
+    "9080-9081,9090-9091,9099-9103,9110-9111,9200,9207,9220,9290,9415,9418,9485,9500,9502-9503,9535,9575,"
+    "9593-9595,9618,9666,9876-9878,9898,9900,9917,9929,9943-9944,9968,9998-10004,10009-10010,10012,"
+    "10024-10025,10082,10180,10215,10243,10566,10616-10617,10621,10626,10628-10629,10778,11110-11111,"
+    "11967,12000,12174,12265,12345,13456,13722,13782-13783,14000,14238,14441-14442,15000,15002-15004,"
+    "15660,15742,16000-16001,16012,16016,16018,16080,16113,16992-16993,17877,17988,18040,18101,18988,"
+    "19101,19283,19315,19350,19780,19801,19842,20000,20005,20031,20221-20222,20828,21571,22939,23502,"
+    "24444,24800,25734-25735,26214,27000,27352-27353,27355-27356,27715,28201,30000,30718,30951,31038,"
+    "31337,32768-32785,33354,33899,34571-34573,35500,38292,40193,40911,41511,42510,44176,44442-44443,"
+    "44501,45100,48080,49152-49161,49163,49165,49167,49175-49176,49400,49999-50003,50006,50300,50389,"
+    "50500,50636,50800,51103,51493,52673,52822,52848,52869,54045,54328,55055-55056,55555,55600,"
+    "56737-56738,57294,57797,58080,60020,60443,61532,61900,62078,63331,64623,64680,65000,65129,65389"
+)
+
+# robots.txt is read in-process; anything beyond this size is ignored
+ROBOTS_MAX_BYTES = 1 << 20
+
+@dataclass
+class Stage:
+    """A single pipeline step and the steps whose output it reads."""
+    name: str
+    step: str
+    error: str
+    command: Optional[List[str]] = None
+    func: Optional[Callable[[], None]] = None
+    output_file: Optional[str] = None
+    deps: Tuple[str, ...] = ()
+    check_file: Optional[str] = None
+    extra_outputs: Tuple[str, ...] = ()
+    cache_ttl: Optional[int] = None
+    cache_inputs: Tuple[str, ...] = ()
+
+class ResultCache:
+    """SQLite store of compressed stage output, keyed by tool and target."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Stages read and write the cache from worker threads
+        self.db = sqlite3.connect(str(path), check_same_thread=False)
+        self.lock = threading.Lock()
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "tool TEXT, target TEXT, input_hash TEXT, fetched_at INTEGER, payload BLOB, "
+            "PRIMARY KEY (tool, target))"
+        )
+
+    def restore(self, tool: str, target: str, input_hash: str, ttl: int, output_file: str) -> bool:
+        """Write a fresh cached result to output_file; return False on a miss."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT input_hash, fetched_at, payload FROM results WHERE tool = ? AND target = ?",
+                (tool, target)
+            ).fetchone()
+        if row is None or row[0] != input_hash or time.time() - row[1] >= ttl:
+            return False
+        Path(output_file).write_bytes(zlib.decompress(row[2]))
+        return True
+
+    def store(self, tool: str, target: str, input_hash: str, output_file: str):
+        """Save the contents of output_file, skipping empty results."""
+        data = Path(output_file).read_bytes()
+        if not data:
+            return
+        payload = zlib.compress(data, 3)
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (tool, target, input_hash, int(time.time()), payload)
+            )
+
+    def close(self):
+        self.db.close()
+
 class ReconPipeline:
-    def __init__(self, target: str):
+    def __init__(self, target: str, use_cache: bool = True, resolvers: Optional[str] = None):
         self.target = target
+        self.use_cache = use_cache
+        self.resolvers = resolvers
+        self.cache: Optional[ResultCache] = None
         self.output_dir = Path("output")
         self.screenshots_dir = Path("screenshots")
         self.js_out_dir = self.output_dir / "js_out"
@@ -33,83 +163,252 @@ class ReconPipeline:
         # Required tools
         self.required_tools = [
             "subfinder", "amass", "dnsx", "naabu", "httpx", 
-            "nuclei", "gau", "unfurl", "ffuf", "gowitness", "curl"
+            "nuclei", "gau", "ffuf", "gowitness"
         ]
         
-        # Total steps
-        self.total_steps = 21
+        self._tools_checked = False
+        self.tool_paths: Dict[str, str] = {}
+        
+        # Limits concurrent child processes; created inside the running event loop
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Total steps, set from the stage list when the pipeline runs
+        self.total_steps = 0
         self.current_step = 0
 
     def log_step(self, step_name: str):
         """Log current step with progress indicator."""
         self.current_step += 1
-        logger.info(f"[{self.current_step}/{self.total_steps}] Running {step_name}...")
+        logger.info("[%d/%d] Running %s...", self.current_step, self.total_steps, step_name)
 
-    def run_command(self, command: List[str], output_file: Optional[str] = None, check: bool = True) -> Tuple[bool, str]:
-        """Run a command and optionally save output to file."""
+    async def _drain(self, stream: asyncio.StreamReader, tail: Deque[bytes]):
+        """Read a child's pipe in chunks, keeping only the last lines."""
+        partial = b""
+        while True:
+            chunk = await stream.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()[-STREAM_CHUNK_SIZE:]
+            tail.extend(lines)
+        if partial:
+            tail.append(partial)
+
+    async def _wait(self, process: asyncio.subprocess.Process, *readers) -> int:
+        """Wait for a child process and its pipe readers, killing it if the pipeline is cancelled."""
         try:
-            if output_file:
-                with open(output_file, 'w') as f:
-                    result = subprocess.run(
-                        command,
-                        stdout=f,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=check
-                    )
-                    return True, "Command executed successfully"
-            else:
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    check=check
-                )
-                return True, result.stdout
-        except subprocess.CalledProcessError as e:
-            return False, e.stderr
+            await asyncio.gather(*readers)
+            return await process.wait()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
 
-    def run_shell_command(self, command: str, output_file: Optional[str] = None) -> Tuple[bool, str]:
-        """Run a shell command using bash."""
+    async def _spawn(self, argv: List[str], out: Optional[str] = None) -> Tuple[int, bytes, bytes]:
+        """Run a child process and return its exit code with the tails of stdout and stderr.
+        
+        Output is never buffered whole: stdout goes straight to the out file,
+        and only the last lines of each stream are kept.
+        """
+        # An absolute path and close_fds=False let subprocess use posix_spawn (vfork) instead of
+        # fork+exec; Python's own descriptors are non-inheritable so none leak into the child
+        argv = [self.tool_paths.get(argv[0], argv[0])] + argv[1:]
+        
+        stdout_tail: Deque[bytes] = deque(maxlen=STREAM_TAIL_LINES)
+        stderr_tail: Deque[bytes] = deque(maxlen=STREAM_TAIL_LINES)
+        stdout_fd = None
+        if out:
+            stdout_fd = os.open(out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        
         try:
-            if output_file:
-                with open(output_file, 'w') as f:
-                    result = subprocess.run(
-                        ["bash", "-c", command],
-                        stdout=f,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=True
-                    )
-                    return True, "Command executed successfully"
-            else:
-                result = subprocess.run(
-                    ["bash", "-c", command],
-                    capture_output=True,
-                    text=True,
-                    check=True
+            if self.semaphore is None:
+                self.semaphore = asyncio.Semaphore(MAX_CHILDREN)
+            async with self.semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=stdout_fd if stdout_fd is not None else asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    close_fds=False
                 )
-                return True, result.stdout
-        except subprocess.CalledProcessError as e:
-            return False, e.stderr
+                readers = [self._drain(process.stderr, stderr_tail)]
+                if stdout_fd is None:
+                    readers.append(self._drain(process.stdout, stdout_tail))
+                returncode = await self._wait(process, *readers)
+        finally:
+            if stdout_fd is not None:
+                os.close(stdout_fd)
+        
+        return returncode, b"\n".join(stdout_tail), b"\n".join(stderr_tail)
+
+    async def run_command(self, command: List[str], output_file: Optional[str] = None,
+                          check: bool = True) -> Tuple[bool, str]:
+        """Run a command and optionally save output to file."""
+        returncode, stdout, stderr = await self._spawn(command, output_file)
+        if check and returncode != 0:
+            return False, stderr.decode(errors="replace")
+        if output_file:
+            return True, "Command executed successfully"
+        return True, stdout.decode(errors="replace")
+
+    async def run_function(self, func: Callable[[], None]) -> Tuple[bool, str]:
+        """Run an in-process step in a worker thread."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, func)
+        except OSError as e:
+            return False, str(e)
+        return True, "Step completed successfully"
+
+    def _line_keys(self, path: Path, first_field: bool = False) -> Iterator[bytes]:
+        """Yield the non-empty lines (or first fields) of a file."""
+        with open(path, 'rb') as r:
+            for line in r:
+                if first_field:
+                    fields = line.split(None, 1)
+                    key = fields[0] if fields else b""
+                else:
+                    key = line.strip()
+                if key:
+                    yield key
+
+    def _json_records(self, path: Path) -> Iterator[Dict]:
+        """Yield the JSON objects of a JSON-lines file, skipping malformed lines."""
+        with open(path, 'rb') as r:
+            for line in r:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def _merge_unique(self, inputs: List[Path], out: Path, first_field: bool = False):
+        """Write the unique lines (or first fields) of several files in sorted order, like sort -u."""
+        keys: Set[bytes] = set()
+        for path in inputs:
+            keys.update(self._line_keys(path, first_field))
+        with open(out, 'wb') as w:
+            w.writelines(key + b"\n" for key in sorted(keys))
+
+    def _top_ports(self) -> Set[int]:
+        """Expand the top 1000 port ranges into a set of port numbers."""
+        ports: Set[int] = set()
+        for item in TOP_1000_PORTS.split(","):
+            first, _, last = item.partition("-")
+            ports.update(range(int(first), int(last or first) + 1))
+        return ports
+
+    def _split_naabu_results(self, results: Path, full_out: Path, top_out: Path, merged_out: Path):
+        """Write naabu JSON results as host:port lines: all ports, top 1000 ports, and de-duplicated."""
+        top_ports = self._top_ports()
+        seen = set()
+        with open(full_out, 'w') as full, open(top_out, 'w') as top, open(merged_out, 'w') as merged:
+            for record in self._json_records(results):
+                host = record.get("host") or record.get("ip")
+                try:
+                    port = int(record.get("port"))
+                except (TypeError, ValueError):
+                    continue
+                if not host:
+                    continue
+                entry = f"{host}:{port}\n"
+                full.write(entry)
+                if port in top_ports:
+                    top.write(entry)
+                if entry not in seen:
+                    seen.add(entry)
+                    merged.write(entry)
+
+    def _split_httpx_results(self, results: Path, subs_out: Path, ports_out: Path, screenshot_out: Path):
+        """Write httpx JSON results as text lines split by input type, plus one URL per distinct page."""
+        seen_pages = set()
+        with open(subs_out, 'w') as subs, open(ports_out, 'w') as ports, open(screenshot_out, 'w') as screenshot:
+            for record in self._json_records(results):
+                url = record.get("url")
+                if not url:
+                    continue
+                tech = ",".join(record.get("tech") or [])
+                text = f"{url} [{record.get('status_code', '')}] [{record.get('title', '')}] [{tech}]\n"
+                # Inputs from the port scan are host:port, subdomains are bare names
+                if ":" in record.get("input", ""):
+                    ports.write(text)
+                else:
+                    subs.write(text)
+                
+                # Look-alike pages (CDN edges, repeated landing pages) only need one screenshot
+                page = (record.get("host", ""), hashlib.sha1(str(record.get("title", "")).encode()).digest(),
+                        tuple(sorted(record.get("tech") or [])))
+                if page not in seen_pages:
+                    seen_pages.add(page)
+                    screenshot.write(url + "\n")
+
+    def _extract_params(self, urls: Path, out: Path):
+        """Write the unique query parameter names found in a URL list."""
+        # Only the distinct names are kept, which stay few even for millions of URLs
+        seen = set()
+        with open(urls, encoding="utf-8", errors="replace") as r, open(out, 'w') as w:
+            for line in r:
+                try:
+                    query = urlsplit(line.strip()).query
+                except ValueError:
+                    continue
+                for key, _ in parse_qsl(query, keep_blank_values=True):
+                    if key and key not in seen:
+                        seen.add(key)
+                        w.write(key + "\n")
+
+    def _fetch_robots(self, out: Path):
+        """Download the target's robots.txt in-process."""
+        conn = http.client.HTTPSConnection(self.target, timeout=10)
+        try:
+            conn.request("GET", "/robots.txt", headers={"User-Agent": "GhostRecon"})
+            out.write_bytes(conn.getresponse().read(ROBOTS_MAX_BYTES))
+        except http.client.HTTPException as e:
+            raise OSError(f"HTTP error: {e}") from e
+        finally:
+            conn.close()
+
+    def _split_dnsx_results(self, results: Path, records_out: Path, hosts_out: Path, cnames_out: Path):
+        """Turn dnsx JSON results into record lines, resolved hosts and CNAME candidates in one pass."""
+        seen = set()
+        with open(records_out, 'w') as records, open(hosts_out, 'w') as hosts, open(cnames_out, 'w') as cnames:
+            for record in self._json_records(results):
+                host = record.get("host")
+                # dnsx also emits answerless records (e.g. NXDOMAIN) that only carry a status
+                if not host or not any(record.get(t) for t in DNS_RECORD_TYPES):
+                    continue
+                if host not in seen:
+                    seen.add(host)
+                    hosts.write(host + "\n")
+                for record_type in DNS_RECORD_TYPES:
+                    for value in record.get(record_type) or []:
+                        records.write(f"{host} [{record_type.upper()}] [{value}]\n")
+                for target in record.get("cname") or []:
+                    cnames.write(f"{host} {target}\n")
 
     def check_tools(self) -> bool:
         """Check if all required tools are installed."""
+        if self._tools_checked:
+            return True
+        
         logger.info("[+] Checking required tools...")
         
+        present = executables_on_path()
+        self.tool_paths = present
         missing_tools = []
         for tool in self.required_tools:
-            if not shutil.which(tool):
+            if tool not in present:
                 missing_tools.append(tool)
             else:
-                logger.info(f"[✓] {tool} found")
+                logger.info("[✓] %s found", tool)
         
         if missing_tools:
-            logger.error(f"❌ Missing required tools: {', '.join(missing_tools)}")
+            logger.error("❌ Missing required tools: %s", ", ".join(missing_tools))
             logger.error("Please run install.py first to install all required tools.")
             return False
         
         logger.info("[✓] All required tools are available")
+        self._tools_checked = True
         return True
 
     def create_directories(self) -> bool:
@@ -121,268 +420,269 @@ class ReconPipeline:
         for directory in directories:
             try:
                 directory.mkdir(parents=True, exist_ok=True)
-                logger.info(f"[✓] Created directory: {directory}/")
+                logger.info("[✓] Created directory: %s/", directory)
             except Exception as e:
-                logger.error(f"Failed to create directory {directory}: {e}")
+                logger.error("Failed to create directory %s: %s", directory, e)
                 return False
         
         return True
 
     def check_file_created(self, file_path: str) -> bool:
         """Check if a file was created and has content."""
-        path = Path(file_path)
-        if path.exists() and path.stat().st_size > 0:
-            logger.info(f"[✓] {file_path} created successfully")
-            return True
-        else:
-            logger.warning(f"[!] {file_path} is empty or not created")
-            return False
+        try:
+            if os.stat(file_path).st_size > 0:
+                logger.info("[✓] %s created successfully", file_path)
+                return True
+        except FileNotFoundError:
+            pass
+        logger.warning("[!] %s is empty or not created", file_path)
+        return False
 
-    def run_recon(self) -> bool:
-        """Main reconnaissance pipeline."""
-        logger.info(f"🚀 Starting reconnaissance on: {self.target}")
-        
-        # Pre-flight checks
-        if not self.check_tools():
-            return False
-        
-        if not self.create_directories():
-            return False
-        
-        logger.info(f"📁 Output directory: {self.output_dir}")
-        logger.info(f"📸 Screenshots directory: {self.screenshots_dir}")
-        
-        # Step 1: Subfinder
-        self.log_step("subfinder")
-        success, output = self.run_command(
-            ["subfinder", "-d", self.target, "-all", "-silent"],
-            f"{self.output_dir}/01_subfinder.txt"
-        )
-        if not success:
-            logger.error(f"Subfinder failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/01_subfinder.txt")
-        
-        # Step 2: Amass passive
-        self.log_step("amass passive")
-        success, output = self.run_command(
-            ["amass", "enum", "-passive", "-d", self.target],
-            f"{self.output_dir}/02_amass_passive.txt"
-        )
-        if not success:
-            logger.error(f"Amass passive failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/02_amass_passive.txt")
-        
-        # Step 3: Merge & de-duplicate
-        self.log_step("merge and de-duplicate subdomains")
-        success, output = self.run_shell_command(
-            f"cat {self.output_dir}/01_subfinder.txt {self.output_dir}/02_amass_passive.txt | sort -u",
-            f"{self.output_dir}/03_subs_uniq.txt"
-        )
-        if not success:
-            logger.error(f"Merge failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/03_subs_uniq.txt")
-        
-        # Step 4: DNS resolve
-        self.log_step("DNS resolution")
-        success, output = self.run_command(
-            ["dnsx", "-l", f"{self.output_dir}/03_subs_uniq.txt", "-a", "-aaaa", "-cname", "-ns", "-resp"],
-            f"{self.output_dir}/04_dnsx_resolved.txt"
-        )
-        if not success:
-            logger.error(f"DNSx failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/04_dnsx_resolved.txt")
-        
-        # Step 5: Extract hosts
-        self.log_step("extract resolved hosts")
-        success, output = self.run_shell_command(
-            f"awk '{{print $1}}' {self.output_dir}/04_dnsx_resolved.txt | sort -u",
-            f"{self.output_dir}/05_hosts_resolved.txt"
-        )
-        if not success:
-            logger.error(f"Host extraction failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/05_hosts_resolved.txt")
-        
-        # Step 6: Naabu top 1000 ports
-        self.log_step("naabu top 1000 ports scan")
-        success, output = self.run_command(
-            ["naabu", "-list", f"{self.output_dir}/05_hosts_resolved.txt", "-p", "top-1000", "-rate", "2000"],
-            f"{self.output_dir}/06_naabu_top1k.txt"
-        )
-        if not success:
-            logger.error(f"Naabu top 1000 failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/06_naabu_top1k.txt")
-        
-        # Step 7: Naabu full TCP sweep
-        self.log_step("naabu full TCP sweep")
-        success, output = self.run_command(
-            ["naabu", "-list", f"{self.output_dir}/05_hosts_resolved.txt", "-p", "-", "-rate", "500"],
-            f"{self.output_dir}/07_naabu_full.txt"
-        )
-        if not success:
-            logger.error(f"Naabu full sweep failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/07_naabu_full.txt")
-        
-        # Step 8: Merge open ports
-        self.log_step("merge open ports")
-        success, output = self.run_shell_command(
-            f"cat {self.output_dir}/06_naabu_top1k.txt {self.output_dir}/07_naabu_full.txt | sort -u",
-            f"{self.output_dir}/08_open_ports.txt"
-        )
-        if not success:
-            logger.error(f"Port merge failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/08_open_ports.txt")
-        
-        # Step 9: HTTPx from subdomains
-        self.log_step("httpx from subdomains")
-        success, output = self.run_command(
-            ["httpx", "-l", f"{self.output_dir}/03_subs_uniq.txt", "-status-code", "-title", "-tech-detect", "-follow-redirects"],
-            f"{self.output_dir}/09_httpx_subs.txt"
-        )
-        if not success:
-            logger.error(f"HTTPx subdomains failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/09_httpx_subs.txt")
-        
-        # Step 10: HTTPx from open ports
-        self.log_step("httpx from open ports")
-        success, output = self.run_command(
-            ["httpx", "-l", f"{self.output_dir}/08_open_ports.txt", "-status-code", "-title", "-tech-detect", "-follow-redirects"],
-            f"{self.output_dir}/10_httpx_ports.txt"
-        )
-        if not success:
-            logger.error(f"HTTPx ports failed: {output}")
+    def build_stages(self) -> List[Stage]:
+        """Describe every pipeline step together with the steps it depends on."""
+        out = self.output_dir
+        # Point every resolving tool at the same resolvers so a caching one is shared
+        resolvers = ["-r", self.resolvers] if self.resolvers else []
+        # Templates are installed and updated by install.py, so skip the startup update check
+        nuclei_opts = ["-disable-update-check", "-silent"]
+        return [
+            # Subdomain discovery
+            Stage("subfinder", "subfinder", "Subfinder",
+                  ["subfinder", "-d", self.target, "-all", "-silent"],
+                  output_file=f"{out}/01_subfinder.txt",
+                  cache_ttl=24 * HOUR),
+            Stage("amass", "amass passive", "Amass passive",
+                  ["amass", "enum", "-passive", "-d", self.target],
+                  output_file=f"{out}/02_amass_passive.txt",
+                  cache_ttl=24 * HOUR),
+            Stage("merge_subs", "merge and de-duplicate subdomains", "Merge",
+                  func=lambda: self._merge_unique(
+                      [out / "01_subfinder.txt", out / "02_amass_passive.txt"], out / "03_subs_uniq.txt"),
+                  check_file=f"{out}/03_subs_uniq.txt",
+                  deps=("subfinder", "amass")),
+            
+            # DNS resolution
+            Stage("dnsx", "DNS resolution", "DNSx",
+                  ["dnsx", "-l", f"{out}/03_subs_uniq.txt", "-a", "-aaaa", "-cname", "-ns", "-resp", "-json"] + resolvers,
+                  output_file=f"{out}/04_dnsx_resolved.json",
+                  deps=("merge_subs",),
+                  cache_ttl=4 * HOUR, cache_inputs=(f"{out}/03_subs_uniq.txt",)),
+            Stage("hosts", "extract resolved hosts and CNAME takeover candidates", "DNS result extraction",
+                  func=lambda: self._split_dnsx_results(
+                      out / "04_dnsx_resolved.json", out / "04_dnsx_resolved.txt",
+                      out / "05_hosts_resolved.txt", out / "12_cname_candidates.txt"),
+                  check_file=f"{out}/05_hosts_resolved.txt",
+                  extra_outputs=(f"{out}/04_dnsx_resolved.txt", f"{out}/12_cname_candidates.txt"),
+                  deps=("dnsx",)),
+            
+            # Port scanning
+            # One full sweep covers the top 1000 ports too; 06/07/08 are derived from it
+            Stage("naabu", "naabu full TCP sweep", "Naabu",
+                  ["naabu", "-list", f"{out}/05_hosts_resolved.txt", "-p", "-", "-rate", "1500",
+                   "-exclude-cdn", "-silent", "-json"] + resolvers,
+                  output_file=f"{out}/07_naabu_full.json",
+                  deps=("hosts",)),
+            Stage("split_ports", "split open ports", "Port split",
+                  func=lambda: self._split_naabu_results(
+                      out / "07_naabu_full.json", out / "07_naabu_full.txt",
+                      out / "06_naabu_top1k.txt", out / "08_open_ports.txt"),
+                  check_file=f"{out}/08_open_ports.txt",
+                  extra_outputs=(f"{out}/06_naabu_top1k.txt", f"{out}/07_naabu_full.txt"),
+                  deps=("naabu",)),
+            
+            # HTTP probing
+            # One httpx run probes subdomains and open ports, sharing its DNS cache and connections
+            Stage("httpx_input", "merge httpx targets", "HTTPx target merge",
+                  func=lambda: self._merge_unique(
+                      [out / "03_subs_uniq.txt", out / "08_open_ports.txt"], out / "09_httpx_input.txt"),
+                  check_file=f"{out}/09_httpx_input.txt",
+                  deps=("merge_subs", "split_ports")),
+            Stage("httpx", "httpx from subdomains and open ports", "HTTPx",
+                  ["httpx", "-l", f"{out}/09_httpx_input.txt", "-status-code", "-title", "-tech-detect",
+                   "-follow-redirects", "-json"] + resolvers,
+                  output_file=f"{out}/09_httpx_all.json",
+                  deps=("httpx_input",),
+                  cache_ttl=HOUR, cache_inputs=(f"{out}/09_httpx_input.txt",)),
+            Stage("httpx_split", "split httpx results", "HTTPx result split",
+                  func=lambda: self._split_httpx_results(
+                      out / "09_httpx_all.json", out / "09_httpx_subs.txt", out / "10_httpx_ports.txt",
+                      out / "11_live_urls_dedup.txt"),
+                  check_file=f"{out}/09_httpx_subs.txt",
+                  extra_outputs=(f"{out}/10_httpx_ports.txt", f"{out}/11_live_urls_dedup.txt"),
+                  deps=("httpx",)),
+            Stage("merge_urls", "merge live URLs", "URL merge",
+                  func=lambda: self._merge_unique(
+                      [out / "09_httpx_subs.txt", out / "10_httpx_ports.txt"], out / "11_live_urls.txt",
+                      first_field=True),
+                  check_file=f"{out}/11_live_urls.txt",
+                  deps=("httpx_split",)),
+            Stage("gowitness", "gowitness screenshots", "Gowitness",
+                  ["gowitness", "file", "-f", f"{out}/11_live_urls_dedup.txt",
+                   "-t", "20", "--timeout", "8", "--log-level", "warn",
+                   "--destination", "screenshots", "--json", "screenshots/gowitness.json"],
+                  check_file="screenshots/gowitness.json",
+                  deps=("httpx_split",)),
+            
+            # Security analysis
+            Stage("nuclei_web", "nuclei CVE/RCE/SQLi web scan", "Nuclei web scan",
+                  ["nuclei", "-l", f"{out}/11_live_urls.txt", "-tags", "cve,rce,sqli",
+                   "-severity", "critical,high,medium", "-rl", "50", "-c", "50"] + nuclei_opts + resolvers,
+                  output_file=f"{out}/13_nuclei_web.txt",
+                  deps=("merge_urls",)),
+            Stage("nuclei_takeover", "nuclei takeover scan", "Nuclei takeover scan",
+                  ["nuclei", "-t", "http/takeovers/", "-l", f"{out}/03_subs_uniq.txt",
+                   "-rl", "30", "-c", "30"] + nuclei_opts + resolvers,
+                  output_file=f"{out}/14_nuclei_takeover.txt",
+                  deps=("merge_subs",)),
+            
+            # Historical & parameter discovery
+            Stage("gau", "GAU historical endpoints", "GAU",
+                  ["gau", "--providers", "wayback,otx,urlscan", self.target],
+                  output_file=f"{out}/15_gau.txt"),
+            Stage("params", "extract parameters", "Parameter extraction",
+                  func=lambda: self._extract_params(out / "15_gau.txt", out / "16_params.txt"),
+                  check_file=f"{out}/16_params.txt",
+                  deps=("gau",)),
+            
+            # Fuzzing
+            # One ffuf process sweeps every live URL, reusing its wordlist and connections
+            Stage("ffuf_dirs", "ffuf directory fuzzing", "FFUF directory fuzzing",
+                  ["ffuf", "-u", "HOST/FUZZ",
+                   "-w", f"{out}/11_live_urls.txt:HOST",
+                   "-w", "/usr/share/wordlists/dirb/common.txt:FUZZ",
+                   "-mode", "clusterbomb", "-ac", "-ach", "-t", "200",
+                   "-mc", "200,204,301,302,307,401,403", "-o", f"{out}/17_ffuf_dirs.json", "-of", "json"],
+                  check_file=f"{out}/17_ffuf_dirs.json",
+                  deps=("merge_urls",)),
+            Stage("ffuf_params", "ffuf parameter fuzzing", "FFUF parameter fuzzing",
+                  ["ffuf", "-u", f"https://{self.target}/search?FUZZ=test",
+                   "-w", f"{out}/16_params.txt", "-mc", "all", "-o", f"{out}/18_ffuf_params.txt", "-of", "txt"],
+                  check_file=f"{out}/18_ffuf_params.txt",
+                  deps=("params",)),
+            
+            # Additional discovery
+            Stage("js", "httpx JS scraping", "HTTPx JS scraping",
+                  ["httpx", "-l", f"{out}/11_live_urls.txt",
+                   "-path", "discovery", "-store-response-dir", f"{out}/js_out",
+                   "-match-regex", "\\.js($|\\?)"] + resolvers,
+                  output_file=f"{out}/19_js_endpoints.txt",
+                  deps=("merge_urls",)),
+            Stage("robots", "robots.txt check", "Robots.txt check",
+                  func=lambda: self._fetch_robots(out / "20_robots.txt"),
+                  check_file=f"{out}/20_robots.txt"),
+        ]
+
+    def _input_hash(self, stage: Stage) -> str:
+        """Fingerprint a cached stage's command line and the input files it reads."""
+        digest = hashlib.sha256()
+        # A changed command (flags, output format, resolvers) must not reuse old output
+        digest.update(json.dumps(stage.command).encode())
+        for path in stage.cache_inputs:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def restore_cached(self, stage: Stage) -> bool:
+        """Reuse a stage's output from an earlier run if it is still fresh."""
+        if self.cache is None or stage.cache_ttl is None:
             return False
-        self.check_file_created(f"{self.output_dir}/10_httpx_ports.txt")
-        
-        # Step 11: Merge live URLs
-        self.log_step("merge live URLs")
-        success, output = self.run_shell_command(
-            f"cat {self.output_dir}/09_httpx_subs.txt {self.output_dir}/10_httpx_ports.txt | awk '{{print $1}}' | sort -u",
-            f"{self.output_dir}/11_live_urls.txt"
-        )
-        if not success:
-            logger.error(f"URL merge failed: {output}")
+        try:
+            return self.cache.restore(stage.name, self.target, self._input_hash(stage),
+                                      stage.cache_ttl, stage.output_file)
+        except (sqlite3.Error, zlib.error, OSError) as e:
+            logger.warning("[!] Cache lookup for %s failed: %s", stage.name, e)
             return False
-        self.check_file_created(f"{self.output_dir}/11_live_urls.txt")
+
+    def store_cached(self, stage: Stage):
+        """Save a stage's output for later runs."""
+        if self.cache is None or stage.cache_ttl is None:
+            return
+        try:
+            self.cache.store(stage.name, self.target, self._input_hash(stage), stage.output_file)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("[!] Caching %s failed: %s", stage.name, e)
+
+    async def run_stage(self, stage: Stage, tasks: Dict[str, "asyncio.Task[bool]"]) -> bool:
+        """Run one stage once all of its dependencies have succeeded."""
+        if stage.deps:
+            results = await asyncio.gather(*(tasks[dep] for dep in stage.deps))
+            if not all(results):
+                logger.warning("[!] Skipping %s: a step it depends on failed", stage.step)
+                return False
         
-        # Step 12: Gowitness screenshots
-        self.log_step("gowitness screenshots")
-        success, output = self.run_command([
-            "gowitness", "file", "-f", f"{self.output_dir}/11_live_urls.txt", 
-            "-t", "5", "--timeout", "10", "--log-level", "warn", 
-            "--destination", "screenshots", "--json", "screenshots/gowitness.json"
-        ])
-        if not success:
-            logger.error(f"Gowitness failed: {output}")
+        # Any error fails only this stage; letting it escape would abort the whole run
+        try:
+            return await self._execute_stage(stage)
+        except Exception as e:
+            logger.error("%s failed: %s", stage.error, e)
             return False
-        logger.info("[✓] Screenshots captured")
+
+    async def _execute_stage(self, stage: Stage) -> bool:
+        """Run a stage (or restore it from the cache) and check its output files."""
+        self.log_step(stage.step)
+        # Hashing and (de)compressing cached output stays off the event loop so
+        # other running stages keep draining their pipes meanwhile
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self.restore_cached, stage):
+            logger.info("[✓] %s restored from cache", stage.output_file)
+            return True
         
-        # Step 13: CNAME takeover candidates
-        self.log_step("CNAME takeover candidates")
-        success, output = self.run_shell_command(
-            f"awk '/CNAME/ {{print $1,$5}}' {self.output_dir}/04_dnsx_resolved.txt",
-            f"{self.output_dir}/12_cname_candidates.txt"
-        )
+        if stage.func is not None:
+            success, output = await self.run_function(stage.func)
+        else:
+            success, output = await self.run_command(stage.command, stage.output_file)
         if not success:
-            logger.error(f"CNAME extraction failed: {output}")
+            logger.error("%s failed: %s", stage.error, output)
             return False
-        self.check_file_created(f"{self.output_dir}/12_cname_candidates.txt")
+        if self.check_file_created(stage.check_file or stage.output_file):
+            await loop.run_in_executor(None, self.store_cached, stage)
+        for file_path in stage.extra_outputs:
+            self.check_file_created(file_path)
+        return True
+
+    async def run_stages(self) -> bool:
+        """Run all stages concurrently, each as soon as its inputs are ready."""
+        self.semaphore = asyncio.Semaphore(MAX_CHILDREN)
         
-        # Step 14: Nuclei high-severity web scan
-        self.log_step("nuclei high-severity web scan")
-        success, output = self.run_command([
-            "nuclei", "-l", f"{self.output_dir}/11_live_urls.txt", 
-            "-severity", "critical,high,medium", "-rl", "50", "-c", "50"
-        ], f"{self.output_dir}/13_nuclei_web.txt")
-        if not success:
-            logger.error(f"Nuclei web scan failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/13_nuclei_web.txt")
+        stages = self.build_stages()
+        self.total_steps = len(stages)
         
-        # Step 15: Nuclei takeover scan
-        self.log_step("nuclei takeover scan")
-        success, output = self.run_command([
-            "nuclei", "-t", "http/takeovers/", "-l", f"{self.output_dir}/03_subs_uniq.txt", 
-            "-rl", "30", "-c", "30"
-        ], f"{self.output_dir}/14_nuclei_takeover.txt")
-        if not success:
-            logger.error(f"Nuclei takeover scan failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/14_nuclei_takeover.txt")
+        tasks: Dict[str, "asyncio.Task[bool]"] = {}
+        for stage in stages:
+            tasks[stage.name] = asyncio.ensure_future(self.run_stage(stage, tasks))
         
-        # Step 16: GAU historical endpoints
-        self.log_step("GAU historical endpoints")
-        success, output = self.run_command([
-            "gau", "--providers", "wayback,otx,urlscan", self.target
-        ], f"{self.output_dir}/15_gau.txt")
-        if not success:
-            logger.error(f"GAU failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/15_gau.txt")
+        # A failed stage only skips the stages that depend on it; independent
+        # stages keep running so their results are not thrown away
+        results = await asyncio.gather(*tasks.values())
+        return all(results)
+
+    def run_recon(self) -> bool:
+        """Main reconnaissance pipeline."""
+        logger.info("🚀 Starting reconnaissance on: %s", self.target)
         
-        # Step 17: Extract params (unfurl)
-        self.log_step("extract parameters")
-        success, output = self.run_shell_command(
-            f"cat {self.output_dir}/15_gau.txt | unfurl --unique keys",
-            f"{self.output_dir}/16_params.txt"
-        )
-        if not success:
-            logger.error(f"Parameter extraction failed: {output}")
+        # Pre-flight checks
+        if not self.check_tools():
             return False
-        self.check_file_created(f"{self.output_dir}/16_params.txt")
         
-        # Step 18: FFUF directory fuzzing
-        self.log_step("ffuf directory fuzzing")
-        success, output = self.run_command([
-            "ffuf", "-u", f"https://{self.target}/FUZZ", 
-            "-w", "/usr/share/wordlists/dirb/common.txt",
-            "-mc", "200,204,301,302,307,401,403", "-o", f"{self.output_dir}/17_ffuf_dirs.txt", "-of", "txt"
-        ])
-        if not success:
-            logger.error(f"FFUF directory fuzzing failed: {output}")
+        if not self.create_directories():
             return False
-        self.check_file_created(f"{self.output_dir}/17_ffuf_dirs.txt")
         
-        # Step 19: FFUF parameter fuzzing
-        self.log_step("ffuf parameter fuzzing")
-        success, output = self.run_command([
-            "ffuf", "-u", f"https://{self.target}/search?FUZZ=test",
-            "-w", f"{self.output_dir}/16_params.txt", "-mc", "all", "-o", f"{self.output_dir}/18_ffuf_params.txt", "-of", "txt"
-        ])
-        if not success:
-            logger.error(f"FFUF parameter fuzzing failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/18_ffuf_params.txt")
+        logger.info("📁 Output directory: %s", self.output_dir)
+        logger.info("📸 Screenshots directory: %s", self.screenshots_dir)
         
-        # Step 20: HTTPx JS scraping
-        self.log_step("httpx JS scraping")
-        success, output = self.run_command([
-            "httpx", "-l", f"{self.output_dir}/11_live_urls.txt", 
-            "-path", "discovery", "-store-response-dir", f"{self.output_dir}/js_out",
-            "-match-regex", "\\.js($|\\?)"
-        ], f"{self.output_dir}/19_js_endpoints.txt")
-        if not success:
-            logger.error(f"HTTPx JS scraping failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/19_js_endpoints.txt")
+        if self.use_cache:
+            try:
+                self.cache = ResultCache(CACHE_PATH)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("[!] Result cache unavailable, running every stage: %s", e)
         
-        # Step 21: Robots.txt
-        self.log_step("robots.txt check")
-        success, output = self.run_command([
-            "curl", "-s", f"https://{self.target}/robots.txt"
-        ], f"{self.output_dir}/20_robots.txt")
-        if not success:
-            logger.error(f"Robots.txt check failed: {output}")
-            return False
-        self.check_file_created(f"{self.output_dir}/20_robots.txt")
+        try:
+            if not asyncio.run(self.run_stages()):
+                return False
+        finally:
+            if self.cache is not None:
+                self.cache.close()
         
         logger.info("\n🎉 Recon complete! Results in ./output and ./screenshots")
         return True
@@ -396,6 +696,7 @@ def main():
 Examples:
   python3 recon.py --target example.com
   python3 recon.py --target subdomain.example.com
+  python3 recon.py --target example.com --no-cache
         """
     )
     
@@ -405,14 +706,35 @@ Examples:
         help="Target domain to scan (e.g., example.com)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached subdomain, DNS and HTTP probe results from earlier runs"
+    )
+    
+    parser.add_argument(
+        "--resolvers",
+        metavar="FILE",
+        help="File of DNS resolvers (e.g. a local caching resolver) for dnsx, naabu, httpx and nuclei"
+    )
+    
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only show warnings and errors"
+    )
+    
     args = parser.parse_args()
     
+    if args.quiet:
+        logging.getLogger().setLevel(logging.WARNING)
+    
     # Validate target format
     if not args.target or '.' not in args.target:
         logger.error("❌ Invalid target format. Please provide a valid domain (e.g., example.com)")
         sys.exit(1)
     
-    pipeline = ReconPipeline(args.target)
+    pipeline = ReconPipeline(args.target, use_cache=not args.no_cache, resolvers=args.resolvers)
     
     try:
         success = pipeline.run_recon()
@@ -421,7 +743,7 @@ Examples:
         logger.info("\n⚠️  Reconnaissance interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":